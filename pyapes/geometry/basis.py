@@ -30,6 +30,21 @@ def n2d_coord(coord: str) -> dict[int, str]:
     return n2d
 
 
+def derivative_keys(coord: str) -> tuple[dict[int, str], dict[tuple[int, int], str]]:
+    """Return the attribute names of `Jac` and `Hess` by the integer axis index in the given coordinate system. The `Hess` names are sorted. e.g. `(1, 0) -> "xy"` in the xyz coordinate and `(1, 0) -> "rz"` in the rz coordinate."""
+
+    n2d = n2d_coord(coord)
+
+    jac_keys = dict(n2d)
+    hess_keys = {
+        (i, j): "".join(sorted(di + dj))
+        for i, di in n2d.items()
+        for j, dj in n2d.items()
+    }
+
+    return jac_keys, hess_keys
+
+
 class GeoTypeIdentifier(list):
     """Class that helps to identify the list of types."""
 
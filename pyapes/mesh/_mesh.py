@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import math
 from functools import cached_property
 from typing import cast
 from typing import Optional
@@ -79,6 +80,11 @@ class Mesh:
         else:
             raise TypeError("Mesh: spacing only accept int or float")
 
+        # Mesh spacing is used in every discretization. Therefore, create the tensor once.
+        self._dx_tensor = torch.tensor(
+            self._dx, dtype=self.dtype.float, device=self.device
+        )
+
         self.x = []
 
         for i in range(self.dim):
@@ -239,9 +245,7 @@ class Mesh:
     def N(self) -> int:
         """Return total number of grid points."""
 
-        return int(
-            torch.prod(torch.tensor(self._nx, dtype=self.dtype.int, device=self.device))
-        )
+        return math.prod(self._nx)
 
     @property
     def size(self) -> float:
@@ -256,8 +260,8 @@ class Mesh:
 
     @property
     def dx(self) -> Tensor:
-        """Mesh spacing."""
-        return torch.tensor(self._dx, dtype=self.dtype.float, device=self.device)
+        """Mesh spacing. Since the tensor is cached, do not modify it in-place."""
+        return self._dx_tensor
 
     @cached_property
     def dg(self) -> list[Tensor]:
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""CUDA kernel for the 3D Laplacian stencil used in `FDC`.
+
+The kernel reads all coefficient bands (e.g. `Ap`, `Ac`, `Am`) of every axis and writes the discretized value of each cell in a single pass. The periodic wrap-around is identical to `torch.roll` so that the result is the same as the default (torch) path.
+
+Note:
+    - The extension is compiled on the first use via `torch.utils.cpp_extension.load_inline`. If the compilation is not possible (e.g. no `nvcc`), `available()` returns `False` and `FDC` falls back to the default path.
+"""
+import warnings
+from types import ModuleType
+
+import torch
+from torch import Tensor
+
+_CPP_SOURCE = "torch::Tensor laplacian_3d(torch::Tensor f, torch::Tensor A);"
+
+_CUDA_SOURCE = r"""
+#include <ATen/cuda/CUDAContext.h>
+#include <c10/cuda/CUDAException.h>
+#include <c10/cuda/CUDAGuard.h>
+#include <torch/extension.h>
+
+template <typename scalar_t>
+__global__ void laplacian_3d_kernel(
+    const scalar_t* __restrict__ f,
+    const scalar_t* __restrict__ A,
+    scalar_t* __restrict__ out,
+    const int nb,
+    const int vdim,
+    const int nx,
+    const int ny,
+    const int nz) {
+  const long n = (long)nx * ny * nz;
+  const long tid = blockIdx.x * (long)blockDim.x + threadIdx.x;
+
+  if (tid >= vdim * n) {
+    return;
+  }
+
+  const int v = tid / n;
+  const long p = tid % n;
+
+  const int nn[3] = {nx, ny, nz};
+  const int c[3] = {(int)(p / ((long)ny * nz)), (int)((p / nz) % ny), (int)(p % nz)};
+  const long stride[3] = {(long)ny * nz, nz, 1};
+
+  const scalar_t* fv = f + v * n;
+  const int half = nb / 2;
+  scalar_t acc = 0;
+
+  for (int j = 0; j < 3; ++j) {
+    for (int k = 0; k < nb; ++k) {
+      // torch.roll(f, k - half, j)[p] = f[p + half - k] with the periodic wrap
+      int q = (c[j] + half - k) % nn[j];
+      if (q < 0) {
+        q += nn[j];
+      }
+      acc += A[((long)(k * 3 + j) * vdim + v) * n + p] *
+             fv[p + (long)(q - c[j]) * stride[j]];
+    }
+  }
+
+  out[tid] = acc;
+}
+
+torch::Tensor laplacian_3d(torch::Tensor f, torch::Tensor A) {
+  TORCH_CHECK(A.device() == f.device(), "laplacian_3d: A and f must be on the same device");
+
+  // Launch on the device of the input (e.g. cuda:1), not the current device
+  const c10::cuda::CUDAGuard device_guard(f.device());
+
+  auto out = torch::empty_like(f);
+
+  const long total = f.numel();
+  const int threads = 256;
+  const int blocks = (total + threads - 1) / threads;
+
+  AT_DISPATCH_FLOATING_TYPES(f.scalar_type(), "laplacian_3d", ([&] {
+    laplacian_3d_kernel<scalar_t>
+        <<<blocks, threads, 0, at::cuda::getCurrentCUDAStream()>>>(
+            f.data_ptr<scalar_t>(),
+            A.data_ptr<scalar_t>(),
+            out.data_ptr<scalar_t>(),
+            A.size(0),
+            f.size(0),
+            f.size(1),
+            f.size(2),
+            f.size(3));
+    C10_CUDA_KERNEL_LAUNCH_CHECK();
+  }));
+
+  return out;
+}
+"""
+
+_EXT: ModuleType | None = None
+_EXT_FAILED: bool = False
+
+
+def available() -> bool:
+    """Return `True` if the CUDA extension is compiled (or can be compiled)."""
+
+    global _EXT, _EXT_FAILED
+
+    if _EXT is not None:
+        return True
+
+    if _EXT_FAILED or not torch.cuda.is_available():
+        return False
+
+    try:
+        from torch.utils.cpp_extension import load_inline
+
+        _EXT = load_inline(
+            name="pyapes_stencil_cuda",
+            cpp_sources=_CPP_SOURCE,
+            cuda_sources=_CUDA_SOURCE,
+            functions=["laplacian_3d"],
+        )
+    except Exception as e:
+        warnings.warn(f"CUDA stencil: compilation failed ({e}). Use default path.")
+        _EXT_FAILED = True
+
+    return _EXT is not None
+
+
+def laplacian_3d(A_coeffs: Tensor, field: Tensor) -> Tensor:
+    """Discretize `field` with the stacked coefficients.
+
+    Args:
+        A_coeffs: coefficients with the shape of `(n_bands, 3, var.dim, *mesh.nx)`.
+        field: variable with the shape of `(var.dim, *mesh.nx)`.
+    """
+
+    assert _EXT is not None, "CUDA stencil: extension is not loaded!"
+
+    return _EXT.laplacian_3d(field.contiguous(), A_coeffs.contiguous())
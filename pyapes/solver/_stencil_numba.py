@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Numba kernels for the Laplacian stencil used in `FDC` on the CPU.
+
+Each kernel visits every cell once and accumulates all coefficient bands (e.g. `Ap`, `Ac`, `Am`) of every axis, therefore, no intermediate tensor is created. The periodic wrap-around is identical to `torch.roll` so that the result is the same as the default (torch) path.
+
+Note:
+    - `numba` is an optional dependency. If it is not installed, `available()` returns `False` and `FDC` falls back to the default path.
+    - Kernels accumulate directly into `out` so that `float32` inputs are not promoted to `float64` by Python float literals.
+"""
+import torch
+from torch import Tensor
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def available() -> bool:
+    """Return `True` if `numba` is installed."""
+    return numba is not None
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _stencil_1d(f, A, out):
+        vdim, nx = f.shape
+        nb = A.shape[0]
+        half = nb // 2
+
+        for i in numba.prange(nx):
+            for v in range(vdim):
+                out[v, i] = 0
+                for b in range(nb):
+                    s = half - b
+                    out[v, i] += A[b, 0, v, i] * f[v, (i + s) % nx]
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _stencil_2d(f, A, out):
+        vdim, nx, ny = f.shape
+        nb = A.shape[0]
+        half = nb // 2
+
+        for i in numba.prange(nx):
+            for v in range(vdim):
+                for j in range(ny):
+                    out[v, i, j] = 0
+                    for b in range(nb):
+                        s = half - b
+                        out[v, i, j] += (
+                            A[b, 0, v, i, j] * f[v, (i + s) % nx, j]
+                            + A[b, 1, v, i, j] * f[v, i, (j + s) % ny]
+                        )
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _stencil_3d(f, A, out):
+        vdim, nx, ny, nz = f.shape
+        nb = A.shape[0]
+        half = nb // 2
+
+        for i in numba.prange(nx):
+            for v in range(vdim):
+                for j in range(ny):
+                    for k in range(nz):
+                        out[v, i, j, k] = 0
+                        for b in range(nb):
+                            s = half - b
+                            out[v, i, j, k] += (
+                                A[b, 0, v, i, j, k] * f[v, (i + s) % nx, j, k]
+                                + A[b, 1, v, i, j, k] * f[v, i, (j + s) % ny, k]
+                                + A[b, 2, v, i, j, k] * f[v, i, j, (k + s) % nz]
+                            )
+
+    _STENCILS = {1: _stencil_1d, 2: _stencil_2d, 3: _stencil_3d}
+
+
+def laplacian(A_coeffs: Tensor, field: Tensor) -> Tensor:
+    """Discretize `field` with the stacked coefficients.
+
+    Args:
+        A_coeffs: coefficients with the shape of `(n_bands, mesh.dim, var.dim, *mesh.nx)`.
+        field: variable with the shape of `(var.dim, *mesh.nx)`.
+    """
+
+    assert numba is not None, "Numba stencil: numba is not installed!"
+
+    out = torch.empty_like(field)
+
+    _STENCILS[field.dim() - 1](field.numpy(), A_coeffs.numpy(), out.numpy())
+
+    return out
@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """Finite Difference for the current field `FDC`. Similar to Openfoam's `FVC` class.
 Each discretization method should create `A_coeffs` and `rhs_adj` attributes.
-The `A_coeffs` contains `Ap`, `Ac`, and `Am` and each coefficient has a dimension of `mesh.dim x var.dim x mesh.nx`. Be careful! leading dimension is `mesh.dim` and not `var.dim`.
+The `A_coeffs` is a single tensor contains `Ap`, `Ac`, and `Am` and has a dimension of `3 x mesh.dim x var.dim x mesh.nx`. Be careful! after the coefficient index, the leading dimension is `mesh.dim` and not `var.dim`.
 """
 import warnings
+import weakref
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import Any
+from typing import Callable
 
 import torch
 from pymytools.indices import tensor_idx
 from torch import Tensor
 
+from pyapes.geometry.basis import derivative_keys
 from pyapes.geometry.basis import n2d_coord
+from pyapes.solver import _stencil_cuda
+from pyapes.solver import _stencil_numba
 from pyapes.solver.tools import default_A_ops
 from pyapes.solver.types import DiscretizerConfigType
 from pyapes.solver.types import DivConfigType
@@ -29,8 +35,8 @@ class Discretizer(ABC):
     Therefore, to use in the `FDM` solver, the boundary conditions `var` should be applied before/during the `linalg` process.
     """
 
-    A_coeffs: list[list[Tensor]] | None = None
-    """Tuple of A operation matrix coefficients."""
+    A_coeffs: Tensor | None = None
+    """A operation matrix coefficients stacked in a single tensor."""
     rhs_adj: Tensor | None = None
     """RHS adjustment tensor."""
     _op_type: str = "Discretizer"
@@ -49,7 +55,7 @@ class Discretizer(ABC):
     def build_A_coeffs(
         *args: Field | Tensor | float | Jac | Hess,
         config: DiscretizerConfigType | None = None,
-    ) -> list[list[Tensor]]:
+    ) -> Tensor:
         """Build the operation matrix coefficients to be used for the discretization.
         `var: Field` is required due to the boundary conditions. Should always return three tensors in `Ap`, `Ac`, and `Am` order.
         """
@@ -64,7 +70,7 @@ class Discretizer(ABC):
         """Return a tensor that is used to adjust `rhs` of the PDE."""
         ...
 
-    def apply(self, A_coeffs: list[list[Tensor]], var: Field) -> Tensor:
+    def apply(self, A_coeffs: Tensor, var: Field) -> Tensor:
         """Apply the discretization to the input `Field` variable."""
 
         assert A_coeffs is not None, "FDC: A_A_coeffs is not defined!"
@@ -78,13 +84,7 @@ class Discretizer(ABC):
 
         # Grad operator returns Jacobian, but Laplacian, Div, and Ddt return scalar (sum over j-index)
         if self.op_type == "Grad":
-            dis_var_dim = []
-            for idx in range(var.dim):
-                grad_d = []
-                for dim in range(var.mesh.dim):
-                    grad_d.append(_A_coeff_var_sum(A_coeffs, var, idx, dim))
-                dis_var_dim.append(torch.stack(grad_d))
-            discretized = torch.stack(dis_var_dim)
+            discretized = _stencil(self.op_type, A_coeffs, var)
 
             if edge:
                 for dim in range(discretized.shape[0]):
@@ -93,19 +93,26 @@ class Discretizer(ABC):
         elif self.op_type == "Div":
             """Div always returns a scalar field. (`discretized.shape[0] == 1`)"""
 
-            discretized = torch.zeros_like(var()[0]).unsqueeze(0)
+            if edge:
+                # Edge is treated for each direction before the summation
+                discretized = torch.zeros_like(var()[0]).unsqueeze(0)
 
-            for idx in range(var.mesh.dim):
-                disc = _A_coeff_var_sum(A_coeffs, var, idx, idx)
-                if edge:
+                for idx in range(var.mesh.dim):
+                    disc = _A_coeff_var_sum(A_coeffs, var, idx, idx)
                     _treat_edge(disc, var, self.op_type, idx, self.var_addition)
-                discretized[0] += disc
-        elif self.op_type == "Laplacian":
-            discretized = torch.zeros_like(var())
+                    discretized[0] += disc
+            else:
+                discretized = _stencil(self.op_type, A_coeffs, var)
 
-            for idx in range(var.dim):
-                for dim in range(var.mesh.dim):
-                    discretized[idx] += _A_coeff_var_sum(A_coeffs, var, idx, dim)
+        elif self.op_type == "Laplacian":
+            if _use_cuda_stencil(A_coeffs, var):
+                # Single pass over the field using the fused CUDA kernel
+                discretized = _stencil_cuda.laplacian_3d(A_coeffs, var())
+            elif _use_numba_stencil(A_coeffs, var):
+                # Single pass over the field using the Numba kernel
+                discretized = _stencil_numba.laplacian(A_coeffs, var())
+            else:
+                discretized = _stencil(self.op_type, A_coeffs, var)
 
             if edge:
                 for dim in range(var.dim):
@@ -168,38 +175,241 @@ class Discretizer(ABC):
         return self.apply(self.A_coeffs, var_i)
 
 
-def _A_coeff_var_sum(
-    A_coeffs: list[list[Tensor]], var: Field, idx: int, dim: int
-) -> Tensor:
+def _use_cuda_stencil(A_coeffs: Tensor, var: Field) -> bool:
+    """Check whether the fused CUDA kernel can be used for the given coefficients and variable."""
+
+    return (
+        var().is_cuda
+        and var().dtype in (torch.float32, torch.float64)
+        and var.mesh.dim == 3
+        and A_coeffs.shape[1:] == (3, *var().shape)
+        and A_coeffs.dtype == var().dtype
+        and _stencil_cuda.available()
+    )
+
+
+def _use_numba_stencil(A_coeffs: Tensor, var: Field) -> bool:
+    """Check whether the Numba kernel can be used for the given coefficients and variable."""
+
+    return (
+        var().device.type == "cpu"
+        and var().dtype in (torch.float32, torch.float64)
+        and A_coeffs.shape[1:] == (var.mesh.dim, *var().shape)
+        and A_coeffs.dtype == var().dtype
+        and _stencil_numba.available()
+    )
+
+
+def _A_coeff_var_sum(A_coeffs: Tensor, var: Field, idx: int, dim: int) -> Tensor:
     """Sum the coefficients and the variable.
-    Here, `len(A_coeffs) = 5` to implement `quick` scheme for `div` operator in the future.
+    The stencil width is inferred from `len(A_coeffs)`. e.g. `len(A_coeffs) = 3` for `Ap`, `Ac`, and `Am`. Therefore, `len(A_coeffs) = 5` can be used to implement `quick` scheme for `div` operator in the future.
 
     Args:
-        A_coeffs (list[list[Tensor]]): A list of coefficient tensors.
+        A_coeffs (Tensor): Stacked coefficient tensor with the shape of `(n_bands, mesh.dim, var.dim, *mesh.nx)`.
         var (Field): The input `Field` variable.
         idx (int): The index of the variable in `var.dim`.
         dim (int): The dimension of the mesh domain.
     """
 
     assert (
-        len(A_coeffs) == 5
-    ), "FDC: the total number of coefficient tensor should be 5!"
+        len(A_coeffs) % 2 == 1
+    ), "FDC: the total number of coefficient tensor should be odd!"
 
-    summed = torch.zeros_like(var[0])
+    v_idx = 0 if var.dim == 1 else idx
 
-    for i, c in enumerate(A_coeffs):
-        if var.dim == 1:
-            coeff = c[dim][0]
-            v_idx = 0
-        else:
-            coeff = c[dim][idx]
-            v_idx = idx
+    field = var[v_idx]
+    summed = torch.zeros_like(field)
+
+    half = len(A_coeffs) // 2
 
-        summed += coeff * torch.roll(var[v_idx], -2 + i, dim)
+    for i, c in enumerate(A_coeffs[:, dim, v_idx]):
+        _shift_add(summed, c, field, i - half, dim)
 
     return summed
 
 
+KernelType = Callable[[Tensor, Tensor | None, Tensor], Tensor]
+"""Stencil kernel type: `kernel(A_coeffs, center, var()) -> discretized`. `center` is `None` if the center bands are not folded."""
+
+_STENCIL_KERNELS: dict[tuple[str, int, int, int, str], KernelType] = {}
+"""Cache of the compiled stencil kernels. Key is `(op_type, mesh.dim, var.dim, n_bands, dtype)`."""
+
+
+def _stencil(op_type: str, A_coeffs: Tensor, var: Field) -> Tensor:
+    """Discretize `var` with the stencil kernel specialized for the operator type, mesh and variable dimensions, and dtype.
+    The kernel is generated and compiled on the first call and reused afterward.
+    """
+
+    assert (
+        A_coeffs.dtype == var().dtype
+    ), f"FDC: dtype of A_coeffs ({A_coeffs.dtype}) and var ({var().dtype}) should match!"
+
+    n_bands = len(A_coeffs)
+    key = (op_type, var.mesh.dim, var.dim, n_bands, str(var().dtype))
+
+    center = _center_band(A_coeffs) if _fold_center(op_type, var.dim) else None
+
+    if key not in _STENCIL_KERNELS:
+        _STENCIL_KERNELS[key] = _compile(
+            _generate_stencil(op_type, var.mesh.dim, var.dim, n_bands)
+        )
+
+    return _STENCIL_KERNELS[key](A_coeffs, center, var())
+
+
+def _fold_center(op_type: str, var_dim: int) -> bool:
+    """The output of `Laplacian` and scalar `Div` is summed over the mesh axes. Therefore, their center bands can be reduced in one go."""
+
+    return op_type == "Laplacian" or (op_type == "Div" and var_dim == 1)
+
+
+_CENTER_BANDS: dict[int, tuple[weakref.ref, int, Tensor]] = {}
+"""Cache of the center band summed over the mesh axes. Key is `id(A_coeffs)` and the value is `(weakref(A_coeffs), A_coeffs._version, center)`."""
+
+
+def _center_band(A_coeffs: Tensor) -> Tensor:
+    """Return the center band of `A_coeffs` summed over the mesh axes (shape of `(var.dim, *mesh.nx)`).
+    Since `A_coeffs` of an operator is constant during the linear solver iterations, the reduction is done once and cached. It is recomputed only if `A_coeffs` is modified in-place, and the cache entry is removed once `A_coeffs` is garbage collected.
+    """
+
+    key = id(A_coeffs)
+    cached = _CENTER_BANDS.get(key)
+
+    if (
+        cached is not None
+        and cached[0]() is A_coeffs
+        and cached[1] == A_coeffs._version
+    ):
+        return cached[2]
+
+    center = A_coeffs[len(A_coeffs) // 2].sum(0)
+    _CENTER_BANDS[key] = (
+        weakref.ref(A_coeffs, lambda _: _CENTER_BANDS.pop(key, None)),
+        A_coeffs._version,
+        center,
+    )
+
+    return center
+
+
+def _generate_stencil(
+    op_type: str, mesh_dim: int, var_dim: int, n_bands: int
+) -> KernelType:
+    """Generate a straight-line stencil function. All loops over the mesh dimension and the coefficients are unrolled in the source, therefore, the function has no branch and no loop. For `Grad` and `Laplacian`, all components of the variable are processed at once (shift along `mesh axis + 1`) instead of one component at a time.
+    For `Laplacian` and scalar `Div`, the center coefficients (no shift) of all mesh axes are summed beforehand (`C`, see `_center_band`) and applied once.
+
+    Example:
+        >>> _generate_stencil("Laplacian", 2, 1, 3)
+        # equivalent to
+        def _laplacian_2d_1(A, C, f):
+            out = torch.zeros_like(f)
+            _shift_add(out, A[0, 0], f, -1, 1)
+            _shift_add(out, A[2, 0], f, 1, 1)
+            _shift_add(out, A[0, 1], f, -1, 2)
+            _shift_add(out, A[2, 1], f, 1, 2)
+            _shift_add(out, C, f, 0, 0)
+            return out
+    """
+
+    name = f"_{op_type.lower()}_{mesh_dim}d_{var_dim}"
+    src = [f"def {name}(A, C, f):"]
+
+    # (out, A index, f, tensor axis to shift)
+    targets: list[tuple[str, str, str, int]] = []
+
+    if op_type == "Grad":
+        src.append(f"    out = f.new_zeros(({var_dim}, {mesh_dim}, *f.shape[1:]))")
+        for j in range(mesh_dim):
+            targets.append((f"out[:, {j}]", f"{j}", "f", j + 1))
+    elif op_type == "Div":
+        # Each mesh axis uses different component of the variable. Therefore, can not be vectorized.
+        src.append("    out = f.new_zeros((1, *f.shape[1:]))")
+        for j in range(mesh_dim):
+            v = 0 if var_dim == 1 else j
+            targets.append(("out[0]", f"{j}, {v}", f"f[{v}]", j))
+    elif op_type == "Laplacian":
+        src.append("    out = torch.zeros_like(f)")
+        for j in range(mesh_dim):
+            targets.append(("out", f"{j}", "f", j + 1))
+    else:
+        raise TypeError(f"FDC: ({op_type=} is not supported!")
+
+    half = n_bands // 2
+
+    fold_center = _fold_center(op_type, var_dim)
+
+    for o_expr, a_idx, f_expr, axis in targets:
+        for b in range(n_bands):
+            if fold_center and b == half:
+                continue
+            src.append(
+                f"    _shift_add({o_expr}, A[{b}, {a_idx}], {f_expr}, {b - half}, {axis})"
+            )
+
+    if op_type == "Laplacian":
+        src.append("    _shift_add(out, C, f, 0, 0)")
+    elif fold_center:
+        src.append("    _shift_add(out[0], C[0], f[0], 0, 0)")
+
+    src.append("    return out")
+
+    namespace = {"torch": torch, "_shift_add": _shift_add}
+    exec("\n".join(src), namespace)
+
+    return namespace[name]
+
+
+def _shift_add(out: Tensor, coeff: Tensor, field: Tensor, shift: int, dim: int) -> None:
+    """Accumulate `coeff * torch.roll(field, shift, dim)` to `out` in-place.
+    Instead of allocating the rolled copy of `field`, the product is computed on the aligned slices (narrowed views) of each tensor. The wrap-around part is kept since the periodic boundary condition relies on it.
+    The product is accumulated with `addcmul_`, therefore, no temporary tensor is allocated for `coeff * field`.
+    """
+
+    n = field.shape[dim]
+    k = shift % n
+
+    if k == 0:
+        out.addcmul_(coeff, field)
+        return
+
+    # Interior part: out[k:] += coeff[k:] * field[:n-k]
+    out.narrow(dim, k, n - k).addcmul_(
+        coeff.narrow(dim, k, n - k), field.narrow(dim, 0, n - k)
+    )
+    # Wrap-around part: out[:k] += coeff[:k] * field[n-k:]
+    out.narrow(dim, 0, k).addcmul_(coeff.narrow(dim, 0, k), field.narrow(dim, n - k, k))
+
+
+def _compile(func: KernelType) -> KernelType:
+    """Compile `func` with `torch.compile`. If the compilation is not possible (e.g. `mps` device or no compiler available), fall back to the eager `func`.
+    Only compilation (`torch._dynamo`/backend) errors trigger the fallback; errors raised by `func` itself (e.g. shape or dtype mismatch) are propagated.
+    """
+
+    try:
+        from torch._dynamo.exc import TorchDynamoException
+
+        compiled = torch.compile(func, fullgraph=True)
+    except (ImportError, RuntimeError) as e:
+        warnings.warn(f"FDC: torch.compile is not available ({e}). Use eager mode.")
+        return func
+
+    def _run(coeffs: Tensor, center: Tensor | None, field: Tensor) -> Tensor:
+        nonlocal compiled
+
+        try:
+            return compiled(coeffs, center, field)
+        except TorchDynamoException as e:
+            # Raises here if the error is not from the compilation
+            res = func(coeffs, center, field)
+
+            warnings.warn(f"FDC: torch.compile failed ({e}). Fall back to eager mode.")
+            compiled = func
+
+            return res
+
+    return _run
+
+
 def _treat_edge(
     discretized: Tensor | list[Tensor],
     var: Field,
@@ -290,7 +500,7 @@ def _treat_edge(
     elif ops == "Div":
         assert isinstance(discretized, Tensor)
 
-        n2d = n2d_coord(var.mesh.coord_sys)
+        jac_keys, _ = derivative_keys(var.mesh.coord_sys)
 
         if isinstance(var_add, Field):
             adv = var_add[dim]
@@ -300,11 +510,11 @@ def _treat_edge(
             else:
                 adv = var_add
         elif isinstance(var_add, float):
-            adv = torch.ones_like(var[dim]) * var_add
+            adv = var_add
         elif isinstance(var_add, Jac):
-            adv = var_add[n2d[dim]]
+            adv = var_add[jac_keys[dim]]
         elif var_add is None:
-            adv = torch.ones_like(var[dim])
+            adv = 1.0
         else:
             raise NotImplementedError("FDC: var_j Hess is not implemented yet!")
 
@@ -324,7 +534,7 @@ def _treat_edge(
         discretized[slicer_1] = (
             -(3 / 2 * bc_val - 2.0 * bc_val_p + 1 / 2 * bc_val_pp)
             / (var.mesh.dx[dim])
-            * adv[slicer_1]
+            * _at(adv, slicer_1)
         )
 
         if var.mesh.coord_sys == "rz" and dim == 0:
@@ -344,12 +554,12 @@ def _treat_edge(
         discretized[slicer_1] = (
             (3 / 2 * bc_val - 2.0 * bc_val_p + 1 / 2 * bc_val_pp)
             / (var.mesh.dx[dim])
-            * adv[slicer_1]
+            * _at(adv, slicer_1)
         )
 
         if var.mesh.coord_sys == "rz" and dim == 0:
             rz_add = torch.nan_to_num(
-                bc_val * adv[slicer_1] / var.mesh.R[slicer_1],
+                bc_val * _at(adv, slicer_1) / var.mesh.R[slicer_1],
                 nan=0.0,
                 posinf=0.0,
                 neginf=0.0,
@@ -373,8 +583,9 @@ class Laplacian(Discretizer):
         self._op_type = __class__.__name__
 
     @staticmethod
-    def build_A_coeffs(var: Field) -> list[list[Tensor]]:
-        App, Ap, Ac, Am, Amm = default_A_ops(var, __class__.__name__)
+    def build_A_coeffs(var: Field) -> Tensor:
+        A_coeffs = default_A_ops(var, __class__.__name__)
+        Ap, Ac, Am = A_coeffs
 
         dx = var.dx
         # Treat boundaries
@@ -420,7 +631,7 @@ class Laplacian(Discretizer):
                 Ac[j][i] /= dx[j] ** 2
                 Am[j][i] /= dx[j] ** 2
 
-        return [App, Ap, Ac, Am, Amm]
+        return A_coeffs
 
     @staticmethod
     def adjust_rhs(var: Field) -> Tensor:
@@ -477,19 +688,20 @@ class Grad(Discretizer):
         self._op_type = __class__.__name__
 
     @staticmethod
-    def build_A_coeffs(var: Field) -> list[list[Tensor]]:
+    def build_A_coeffs(var: Field) -> Tensor:
         r"""Build the coefficients for the discretization of the gradient operator using the second-order central finite difference method.
 
         ..math::
             \nabla \Phi = \frac{\Phi^{i+1} - \Phi^{i-1}}{2 \Delta x}
         """
-        App, Ap, Ac, Am, Amm = default_A_ops(var, __class__.__name__)
+        A_coeffs = default_A_ops(var, __class__.__name__)
+        Ap, Ac, Am = A_coeffs
 
         if var.bcs is not None:
             for i in range(var.dim):
                 _grad_central_adjust(var, [Ap, Ac, Am], i)
 
-        return [App, Ap, Ac, Am, Amm]
+        return A_coeffs
 
     @staticmethod
     def adjust_rhs(var: Field) -> Tensor:
@@ -507,9 +719,13 @@ def _grad_rhs_adjust(
 ) -> None:
     """Adjust the RHS for the gradient operator. This function is seperated from the class to be reused in the `Div` operator."""
 
+    gamma_min: Tensor | float
+    gamma_max: Tensor | float
+
     if gamma is None:
-        gamma_min = torch.ones_like(var())
-        gamma_max = torch.ones_like(var())
+        # Unit gamma. Use scalar instead of allocating tensors filled with ones.
+        gamma_min = 1.0
+        gamma_max = 1.0
     else:
         if len(gamma) == 1:
             gamma_min = 2.0 * gamma[0]
@@ -527,13 +743,13 @@ def _grad_rhs_adjust(
                     rhs_adj[dim][bc.bc_mask_prev] -= (
                         (1 / 3)
                         * (at_bc * bc.bc_n_vec[j])
-                        * gamma_max[dim][bc.bc_mask_prev]
+                        * _at(gamma_max, (dim, bc.bc_mask_prev))
                     )
                 else:
                     rhs_adj[dim][bc.bc_mask_prev] -= (
                         (1 / 3)
                         * (at_bc * bc.bc_n_vec[j])
-                        * gamma_min[dim][bc.bc_mask_prev]
+                        * _at(gamma_min, (dim, bc.bc_mask_prev))
                     )
             else:
                 # Dirichlet and Symmetry BC: Do nothing
@@ -542,7 +758,7 @@ def _grad_rhs_adjust(
 
 def _grad_central_adjust(
     var: Field,
-    A_ops: list[list[Tensor]],
+    A_ops: list[Tensor],
     dim: int,
     gamma: tuple[Tensor, ...] | None = None,
 ) -> None:
@@ -550,15 +766,19 @@ def _grad_central_adjust(
 
     Args:
         var (Field): input variable to be discretized
-        A_ops (tuple[list[Tensor], ...]): tuple of lists of tensors containing the coefficients of the discretization. `len(A_ops) == 3` since we need `Ap`, `Ac`, and `Am` coefficients.
+        A_ops (list[Tensor]): list of tensors containing the coefficients of the discretization. `len(A_ops) == 3` since we need `Ap`, `Ac`, and `Am` coefficients. Each tensor is modified in-place.
         dim (int): variable dimension. It should be in the range of `var.dim`. Defaults to 0.
         it is not the dimension of the mesh!
         gamma: advection term that accounts the divergence operation
     """
 
+    gamma_min: Tensor | float
+    gamma_max: Tensor | float
+
     if gamma is None:
-        gamma_min = torch.ones_like(var())
-        gamma_max = torch.ones_like(var())
+        # Unit gamma. Use scalar instead of allocating tensors filled with ones.
+        gamma_min = 1.0
+        gamma_max = 1.0
     else:
         if len(gamma) == 1:
             gamma_min = gamma[0]
@@ -580,8 +800,8 @@ def _grad_central_adjust(
                 continue
 
             if bc.bc_type == "neumann" or bc.bc_type == "symmetry":
-                gmx_at_mask = gamma_max[dim][bc.bc_mask_prev]
-                gmn_at_mask = gamma_min[dim][bc.bc_mask_prev]
+                gmx_at_mask = _at(gamma_max, (dim, bc.bc_mask_prev))
+                gmn_at_mask = _at(gamma_min, (dim, bc.bc_mask_prev))
 
                 if bc.bc_n_dir < 0:
                     # At lower side
@@ -624,7 +844,7 @@ class Div(Discretizer):
         var_j: Field | float | Tensor | Hess | Jac,
         var_i: Field,
         config: DiscretizerConfigType,
-    ) -> list[list[Tensor]]:
+    ) -> Tensor:
         r"""Build the coefficients for the discretization of the gradient operator using the second-order central finite difference method. `i` and `j` indicates the Einstein summation convention. Here, `j` comes first to be consistent with the equation:
 
         ..math::
@@ -645,23 +865,24 @@ class Div(Discretizer):
 
         limiter = _check_limiter(config["div"])
 
-        App, Ap, Ac, Am, Amm = default_A_ops(var_i, __class__.__name__)
+        A_coeffs = default_A_ops(var_i, __class__.__name__)
+        Ap, Ac, Am = A_coeffs
 
         if limiter == "none":
-            Ap, Ac, Am = _adv_central(adv, var_i, [Ap, Ac, Am])
+            _adv_central(adv, var_i, [Ap, Ac, Am])
         elif limiter == "upwind":
             if isinstance(adv, Hess):
                 raise NotImplementedError(
                     "FDC: Upwind limiter is not implemented for Hessians and Jacobians advection term."
                 )
             else:
-                Ap, Ac, Am = _adv_upwind(adv, var_i, [Ap, Ac, Am])
+                _adv_upwind(adv, var_i, [Ap, Ac, Am])
         elif limiter == "quick":
             raise NotImplementedError("FDC Div: quick scheme is not implemented yet.")
         else:
             raise RuntimeError(f"FDC Div: {limiter=} is an unknown limiter type.")
 
-        return [App, Ap, Ac, Am, Amm]
+        return A_coeffs
 
     @staticmethod
     def adjust_rhs(
@@ -706,14 +927,14 @@ def _check_limiter(config: DivConfigType | None) -> str:
 
 
 def _adv_central(
-    adv: Tensor | Hess | Jac, var: Field, A_ops: list[list[Tensor]]
-) -> list[list[Tensor]]:
+    adv: Tensor | Hess | Jac, var: Field, A_ops: list[Tensor]
+) -> list[Tensor]:
     """Discretization of the advection tern using central difference.
 
     Args:
         adv (Tensor): Advection term, i.e., `var_j`.
         var (Field): variable to be discretized. i.e., `var_i`.
-        A_ops (tuple[list[Tensor], ...]): Discretization coefficients.
+        A_ops (list[Tensor]): Discretization coefficients. Modified in-place.
     """
 
     # Leading dimension is the dimension of the mesh
@@ -721,16 +942,16 @@ def _adv_central(
     # A_[mesh.dim][var.dim]
     Ap, Ac, Am = A_ops
 
-    n2d = n2d_coord(var.mesh.coord_sys)
+    jac_keys, hess_keys = derivative_keys(var.mesh.coord_sys)
 
     advection = torch.zeros_like(var()[0])
 
     for i in range(var.dim):
         for j in range(var.mesh.dim):
             if isinstance(adv, Jac):
-                advection = adv[n2d[i]]
+                advection = adv[jac_keys[i]]
             elif isinstance(adv, Hess):
-                advection = adv[n2d[i] + n2d[j]]
+                advection = adv[hess_keys[i, j]]
             else:
                 advection = adv[i]
             Ap[j][i] *= torch.roll(advection, -1, dims=j)
@@ -744,18 +965,18 @@ def _adv_central(
 
 
 def _adv_upwind(
-    adv: Tensor | Hess | Jac, var: Field, A_ops: list[list[Tensor]]
-) -> list[list[Tensor]]:
-    n2d = n2d_coord(var.mesh.coord_sys)
-
+    adv: Tensor | Hess | Jac, var: Field, A_ops: list[Tensor]
+) -> list[Tensor]:
     Ap, Ac, Am = A_ops
 
+    jac_keys, _ = derivative_keys(var.mesh.coord_sys)
+
     zeros = torch.zeros_like(var()[0])
 
     for i in range(var.dim):
         for j in range(var.mesh.dim):
             if isinstance(adv, Jac):
-                advection = adv[n2d[i]]
+                advection = adv[jac_keys[i]]
             elif isinstance(adv, Tensor):
                 advection = adv[i]
             else:
@@ -776,22 +997,28 @@ def _div_var_j_to_tensor(var_j: Field | Tensor | float | Jac, var_i: Field) -> T
     """In `Div` operator, convert `var_j` to a `Tensor`. Also check the shape of `var_j` so that is has the same shape of target variable `var_i`."""
 
     if isinstance(var_j, float):
-        adv = torch.ones_like(var_i()) * var_j
+        adv = torch.full_like(var_i(), var_j)
     elif isinstance(var_j, Tensor):
-        adv = var_j
+        adv = var_j.to(dtype=var_i().dtype)
         # Shape check
         assert adv.shape == var_i().shape, "FDC Div: adv shape must match var_i shape"
     elif isinstance(var_j, Field):
         adv = var_j()
     else:
-        n2d = n2d_coord(var_i.mesh.coord_sys)
-        adv = torch.zeros((len(var_j), *var_i().shape[1:]))
+        jac_keys, _ = derivative_keys(var_i.mesh.coord_sys)
+        adv = var_i().new_zeros((len(var_j), *var_i().shape[1:]))
         for i in range(len(var_j)):
-            adv[i] = var_j[n2d[i]]
+            adv[i] = var_j[jac_keys[i]]
 
     return adv
 
 
+def _at(val: Tensor | float, idx: Any) -> Tensor | float:
+    """Return `val[idx]`. If `val` is a scalar, return `val` itself since it is uniform over the domain."""
+
+    return val if isinstance(val, float) else val[idx]
+
+
 def _gamma_from_adv(adv: Tensor, var: Field) -> tuple[Tensor, Tensor]:
     zeros = torch.zeros_like(var())
     gamma_min = torch.min(adv, zeros)
@@ -837,20 +1064,19 @@ class DiffFlux:
         jac_var = jacobian(var)
         flux = Field("DiffFlux", len(jac_var), var.mesh, None)
 
-        n2d = n2d_coord(var.mesh.coord_sys)
+        is_rz = var.mesh.coord_sys == "rz"
+        jac_keys, hess_keys = derivative_keys(var.mesh.coord_sys)
 
         for i in range(var.mesh.dim):
             diff_flux = torch.zeros_like(var()[0])
             for j in range(var.mesh.dim):
-                j_key = n2d[j]
-                h_key = n2d[i] + n2d[j]
-
-                if n2d[i] == "r":
-                    d_coeff = var.mesh.grid[0] * diff[h_key]
+                if is_rz and i == 0:
+                    # Radial direction
+                    d_coeff = var.mesh.grid[0] * diff[hess_keys[i, j]]
                 else:
-                    d_coeff = diff[h_key]
+                    d_coeff = diff[hess_keys[i, j]]
 
-                diff_flux += d_coeff * jac_var[j_key]
+                diff_flux += d_coeff * jac_var[jac_keys[j]]
 
             flux.set_var_tensor(diff_flux, i)
 
@@ -16,6 +16,7 @@ import torch
 from torch import Tensor
 
 from pyapes.mesh import Mesh
+from pyapes.solver import fdc
 from pyapes.solver.fdc import FDC
 from pyapes.solver.types import DiscretizerConfigType
 from pyapes.solver.types import OPStype
@@ -74,7 +75,8 @@ class Operators:
 
     def __eq__(self, other: Field | Tensor | float) -> Operators:
         if isinstance(other, Tensor):
-            self._rhs = other
+            # Match the precision of the target variable (e.g. `float64` RHS for the `single` mesh)
+            self._rhs = other.to(dtype=self.var().dtype, device=self.var().device)
         elif isinstance(other, Field):
             self._rhs = other()
         else:
@@ -137,6 +139,11 @@ class Laplacian(Operators):
 
         A_coeffs = FDC({"laplacian": {"edge": False}}).laplacian.build_A_coeffs(var)
 
+        if _is_foldable(coeffs, var().shape):
+            # Fold the coefficient into A_coeffs. Therefore, Aop does not need to scale the result every call.
+            A_coeffs.mul_(coeffs)  # type: ignore
+            coeffs = None
+
         self._var = var
         self._ops[0] = {
             "name": self.__class__.__name__,
@@ -156,17 +163,14 @@ class Laplacian(Operators):
         return self._var
 
     @staticmethod
-    def Aop(
-        param: float | Tensor | None, var: Field, A_coeffs: list[list[Tensor]]
-    ) -> Tensor:
+    def Aop(param: float | Tensor | None, var: Field, A_coeffs: Tensor) -> Tensor:
         """Compute `Ax` of the linear system `Ax = b`. If param is not None, the whole operation is multiplied by param."""
 
-        fdc = FDC({"laplacian": {"edge": False}})
-
         if param is None:
-            return fdc.laplacian.apply(A_coeffs, var)
+            return _LAPLACIAN_AOP.apply(A_coeffs, var)
         else:
-            return fdc.laplacian.apply(A_coeffs, var) * param
+            # Scale in-place to avoid allocating another temporary tensor
+            return _LAPLACIAN_AOP.apply(A_coeffs, var).mul_(param)
 
 
 class Grad(Operators):
@@ -199,6 +203,11 @@ class Grad(Operators):
 
         A_coeffs = FDC({"grad": {"edge": False}}).grad.build_A_coeffs(var)
 
+        # Grad returns the Jacobian whose shape differs from A_coeffs. Only scalar coefficient can be folded.
+        if _is_foldable(coeffs, ()):
+            A_coeffs.mul_(coeffs)  # type: ignore
+            coeffs = None
+
         self._var = var
         self._ops[0] = {
             "name": self.__class__.__name__,
@@ -217,17 +226,14 @@ class Grad(Operators):
         return self._var
 
     @staticmethod
-    def Aop(
-        param: float | Tensor | None, var: Field, A_coeffs: list[list[Tensor]]
-    ) -> Tensor:
+    def Aop(param: float | Tensor | None, var: Field, A_coeffs: Tensor) -> Tensor:
         """Compute `Ax` of the linear system `Ax = b`. If param is not None, the whole operation is multiplied by param."""
 
-        fdc = FDC({"grad": {"edge": False}})
-
         if param is None:
-            return fdc.grad.apply(A_coeffs, var)
+            return _GRAD_AOP.apply(A_coeffs, var)
         else:
-            return fdc.grad.apply(A_coeffs, var) * param
+            # Scale in-place to avoid allocating another temporary tensor
+            return _GRAD_AOP.apply(A_coeffs, var).mul_(param)
 
 
 class Div(Operators):
@@ -297,19 +303,20 @@ class Div(Operators):
         var_j: Field | Tensor | float,
         config: DiscretizerConfigType,
         var_i: Field,
-        A_coeffs: list[list[Tensor]],
+        A_coeffs: Tensor,
     ) -> Tensor:
         """Compute `Ax` for the linear system of `Ax=b`. If `var_j` is either `Tensor` or `float`, assume that the advection term is constant. Therefore, reuse `A_coeffs`. Otherwise, update `A_coeffs` every step to compute `Ax`."""
 
-        fdc = FDC(config)
+        _DIV_AOP.set_config(config)
+        _DIV_AOP.var_addition = var_j
 
         if isinstance(var_j, Tensor | float):
             # Reuse A_coeffs
-            return fdc.div.apply(A_coeffs, var_i)
+            return _DIV_AOP.apply(A_coeffs, var_i)
         else:
             # Update A_coeffs
-            _A_coeffs = fdc.div.build_A_coeffs(var_j, var_i, config)
-            return fdc.div.apply(_A_coeffs, var_i)
+            _A_coeffs = _DIV_AOP.build_A_coeffs(var_j, var_i, config)
+            return _DIV_AOP.apply(_A_coeffs, var_i)
 
 
 class Ddt(Operators):
@@ -405,3 +412,25 @@ class FDM:
 
             # Currently only `Div`` operator requires config
             self.div.update_config(config)
+
+
+def _is_foldable(coeffs: float | Tensor | None, shape: tuple[int, ...]) -> bool:
+    """Check whether `coeffs` can be folded into `A_coeffs`: `float` or `Tensor` that broadcasts to `shape`. Since the scale is applied per cell, `coeffs * (A @ x) == (coeffs * A) @ x`."""
+
+    if isinstance(coeffs, float):
+        return True
+    elif isinstance(coeffs, Tensor):
+        try:
+            return torch.broadcast_shapes(coeffs.shape, shape) == shape
+        except RuntimeError:
+            return False
+    else:
+        return False
+
+
+# Discretizers used in `Aop`. `Aop` is called every iteration of the solver, therefore, the discretizers are created once here instead of constructing `FDC` every call. They are separated from the `FDC` class attributes so that other `FDC` objects do not change their configuration.
+_LAPLACIAN_AOP = fdc.Laplacian()
+_LAPLACIAN_AOP.set_config({"laplacian": {"edge": False}})
+_GRAD_AOP = fdc.Grad()
+_GRAD_AOP.set_config({"grad": {"edge": False}})
+_DIV_AOP = fdc.Div()
@@ -5,6 +5,7 @@ Following methods are currently available to solve the linear system of equation
 * CG (Conjugated Gradient)
 * BICGSTAB (Bi-Conjugated Gradient Stabilized)
 """
+import math
 import warnings
 from typing import Callable
 from typing import TypedDict
@@ -33,7 +34,7 @@ class ReportType(TypedDict):
 def solve(
     var: Field,
     rhs: Tensor,
-    Aop: Callable[[Field, dict[int, OPStype]], Tensor],
+    Aop: Callable[[Field, dict[int, OPStype], Tensor | None], Tensor],
     eqs: dict[int, OPStype],
     config: FDMSolverConfig,
     mesh: Mesh,
@@ -74,7 +75,7 @@ def solve(
 def cg(
     var: Field,
     rhs: Tensor,
-    Aop: Callable[[Field, dict[int, OPStype]], Tensor],
+    Aop: Callable[[Field, dict[int, OPStype], Tensor | None], Tensor],
     eqs: dict[int, OPStype],
     config: FDMSolverConfig,
     mesh: Mesh,
@@ -91,17 +92,20 @@ def cg(
     # Initial iterations
     itr = 0
 
-    slicer = boundary_slicer(mesh.dim, var.bcs)
+    # Slicer for all components of the variable. Therefore, Aop is called only once for all components.
+    slicer = (slice(None), *boundary_slicer(mesh.dim, var.bcs))
 
     # Initial values
     _apply_bc_otf(var, mesh)
     Ad = torch.zeros_like(rhs)
 
+    # Reusable buffer for the result of Aop
+    Ax = var.zeros_like_tensor()
+
     # Initial residue
     # Ax - b = r
     r = var.zeros_like_tensor()
-    for i in range(var.dim):
-        r[i][slicer] = rhs[i][slicer] - Aop(var, eqs)[i][slicer]
+    r[slicer] = rhs[slicer] - Aop(var, eqs, Ax)[slicer]
 
     d = var.copy(name="d")
     d.set_var_tensor(r.clone())
@@ -111,8 +115,7 @@ def cg(
 
         # CG steps
         # Act of operational matrix in the search direction
-        for i in range(var.dim):
-            Ad[i][slicer] = Aop(d, eqs)[i][slicer]
+        Ad[slicer] = Aop(d, eqs, Ax)[slicer]
 
         # Magnitude of the jump
         alpha = _nan_to_num(
@@ -162,7 +165,7 @@ def cg(
 def bicgstab(
     var: Field,
     rhs: Tensor,
-    Aop: Callable[[Field, dict[int, OPStype]], Tensor],
+    Aop: Callable[[Field, dict[int, OPStype], Tensor | None], Tensor],
     eqs: dict[int, OPStype],
     config: FDMSolverConfig,
     mesh: Mesh,
@@ -183,14 +186,17 @@ def bicgstab(
     # Initial residue
     itr = 0
 
-    slicer = boundary_slicer(mesh.dim, var.bcs)
+    # Slicer for all components of the variable. Therefore, Aop is called only once for all components.
+    slicer = (slice(None), *boundary_slicer(mesh.dim, var.bcs))
 
     _apply_bc_otf(var, mesh)
 
+    # Reusable buffer for the result of Aop
+    Ax = var.zeros_like_tensor()
+
     # Initial residue
     r0 = var.zeros_like_tensor()
-    for i in range(var.dim):
-        r0[i][slicer] = rhs[i][slicer] - Aop(var, eqs)[i][slicer]
+    r0[slicer] = rhs[slicer] - Aop(var, eqs, Ax)[slicer]
 
     r = r0.clone()
     t = var.zeros_like_tensor()
@@ -216,17 +222,13 @@ def bicgstab(
         # Update p in-place
         p.set_var_tensor(r + beta * (p() - omega * v))
 
-        for i in range(var.dim):
-            v[i][slicer] = Aop(p, eqs)[i][slicer]
+        v[slicer] = Aop(p, eqs, Ax)[slicer]
 
         itr += 1
 
         # alpha = rho / dot(r0, v)
         alpha = _nan_to_num(rho / torch.sum(r0 * v, dim=var.mesh_axis))
 
-        if torch.isnan(v).sum() > 0:
-            pass
-
         s.set_var_tensor(r - alpha * v)
 
         # Check tolerance
@@ -239,8 +241,7 @@ def bicgstab(
             finished = True
             continue
 
-        for i in range(var.dim):
-            t[i][slicer] = Aop(s, eqs)[i][slicer]
+        t[slicer] = Aop(s, eqs, Ax)[slicer]
 
         # omega dot(t, s) / dot(t, t)
         omega = _nan_to_num(
@@ -291,9 +292,9 @@ def _apply_bc_otf(var: Field, mesh: Mesh) -> Field:
             #     var_t[0][var.mask_inner[m]] = v
             raise NotImplementedError
 
-        # Apply BC
+        # Apply BC (constant Dirichlet BCs are batched)
         for d in range(var.dim):
-            for bc in var.bcs:
+            for bc in var.bcs_grouped:
                 bc.apply(var(), mesh.grid, d)
 
     return var
@@ -305,6 +306,14 @@ def _nan_to_num(t_in: Tensor) -> Tensor:
     return torch.nan_to_num(t_in, nan=0.0, posinf=0.0, neginf=0.0)
 
 
+def _component_norm(var_new: Tensor, var_old: Tensor) -> Tensor:
+    """L2 norm of `var_new - var_old` for each variable dimension (leading dimension)."""
+
+    diff = (var_new - var_old).flatten(1)
+
+    return torch.sqrt(torch.sum(diff * diff, dim=1))
+
+
 def _solution_report(itr: int, tol: float, method: str) -> None:
     """Report result of the solver with total number of iterations, solution tolerance."""
 
@@ -324,15 +333,13 @@ def _tolerance_check(var_new: Tensor, var_old: Tensor) -> float:
     Raise:
         RuntimeError: if unrealistic value detected.
     """
-    dim = var_new.shape[0]
 
-    tol = torch.zeros(dim, dtype=var_new.dtype)
-    for d in range(dim):
-        tol[d] = torch.linalg.norm(var_new[d] - var_old[d])
+    # Single device to host transfer for all variable dimensions
+    tol = torch.max(_component_norm(var_new, var_old)).item()
 
     # Check validity of tolerance
-    if torch.isnan(tol) or torch.isinf(tol):
+    if math.isnan(tol) or math.isinf(tol):
         msg = f"Invalid tolerance detected! tol: {tol}"
         raise RuntimeError(msg)
 
-    return torch.max(tol).item()
+    return tol
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 import torch
 from torch import Tensor
 
+from pyapes.solver.fdc import FDC
+from pyapes.solver.fdm import Laplacian
 from pyapes.solver.fdm import Operators
 from pyapes.solver.fdm import OPStype
 from pyapes.solver.linalg import ReportType
@@ -76,6 +78,10 @@ class Solver:
                     rhs_func = self.eqs[e]["adjust_rhs"]
                     self.rhs += rhs_func(self.var)  # type: ignore
 
+        # Operators used to compute Aop in the solver. If possible, all operators are fused into a single stencil.
+        fused = _fuse_eqs(self.eqs)
+        self.eqs_solve = fused if fused is not None else self.eqs
+
         # Resetting ops and rhs to avoid unnecessary copy when fdm is used multiple times in separate solvers
         eq.ops = {}
         eq.rhs = None
@@ -87,7 +93,7 @@ class Solver:
             self.rhs is not None
         ), "Solver: rhs is missing. Did't you forget to set equation?"
 
-        return _Aop(var, self.eqs)
+        return _Aop(var, self.eqs_solve)
 
     def solve(self) -> ReportType:
         """Solve the PDE."""
@@ -103,7 +109,7 @@ class Solver:
             self.var,
             self.rhs,
             _Aop,
-            self.eqs,
+            self.eqs_solve,
             self.config["fdm"],
             self.var.mesh,
         )
@@ -119,15 +125,16 @@ class Solver:
         return desc
 
 
-def _Aop(target: Field, eqs: dict[int, OPStype]) -> Tensor:
+def _Aop(target: Field, eqs: dict[int, OPStype], out: Tensor | None = None) -> Tensor:
     """Return tensor of discretized operation used for the Conjugated gradient method.
     Therefore, from the system of equation `Ax = b`, Aop will be `-Ax`.
 
     Note:
         - This function is intentionally separated from `Solver` class to make the `solve` process more transparent. (`rhs` and `eqs` are explicitly passed to the function)
+        - If `out` is given, the result is written to `out` (reset to zero first) instead of allocating a new tensor. Useful for the iterative solvers where `Aop` is called every iteration.
     """
 
-    res = torch.zeros_like(target())
+    res = torch.zeros_like(target()) if out is None else out.zero_()
 
     for op in eqs:
         if eqs[op]["name"].lower() == "ddt":
@@ -137,18 +144,80 @@ def _Aop(target: Field, eqs: dict[int, OPStype]) -> Tensor:
 
         # Compute A @ x
         # NOTE: Could not fix type issue here.
-        Ax = (
-            eqs[op]["Aop"](*eqs[op]["param"], target, eqs[op]["A_coeffs"])  # type: ignore
-            * eqs[op]["sign"]
+        Ax = eqs[op]["Aop"](
+            *eqs[op]["param"], target, eqs[op]["A_coeffs"]
         )  # type: ignore
 
         if eqs[op]["name"].lower() == "grad":
             # If operator is grad, re-shape to match the size of the target variable
             Ax = Ax.view(target.size)
 
-        res += Ax
+        # Apply sign and accumulate in a single in-place operation
+        res.add_(Ax, alpha=eqs[op]["sign"])
 
     if eqs[0]["name"].lower() == "ddt":
         res += eqs[0]["Aop"](*eqs[0]["param"], target)  # type: ignore
 
     return res
+
+
+def _fuse_eqs(eqs: dict[int, OPStype]) -> dict[int, OPStype] | None:
+    """Fuse all operators into a single `Laplacian` type operator by summing `A_coeffs` (multiplied by the sign and the constant parameter of each operator). Therefore, `Aop` only requires a single pass of the stencil over the target variable instead of one pass and one temporary tensor per operator.
+
+    Note:
+        - Only the operators with constant `A_coeffs` and without edge treatment can be fused: `Laplacian`, `Div` of a scalar field with the constant advection (`float` or `Tensor`), and `Grad` in 1D.
+        - If any operator can not be fused, return `None` and `_Aop` iterates over `eqs` as usual.
+    """
+
+    A_fused: Tensor | None = None
+
+    for op in eqs.values():
+        name = op["name"].lower()
+        target = op["target"]
+
+        if name in ["laplacian", "grad"]:
+            param = op["param"][0]
+
+            if name == "grad" and target.mesh.dim != 1:
+                # Grad returns the Jacobian. Only in 1D, it has the same shape of the target.
+                return None
+
+            if isinstance(param, Tensor) and not (
+                param.numel() == 1 or param.shape == target().shape
+            ):
+                return None
+
+            scale = 1.0 if param is None else param
+        elif name == "div":
+            var_j, config = op["param"]
+
+            if (
+                not isinstance(var_j, Tensor | float)
+                or target.dim != 1
+                or config["div"]["edge"]
+            ):
+                return None
+
+            scale = 1.0
+        else:
+            return None
+
+        A_coeffs = op["A_coeffs"] * (op["sign"] * scale)  # type: ignore
+
+        A_fused = A_coeffs if A_fused is None else A_fused.add_(A_coeffs)
+
+    if A_fused is None:
+        return None
+
+    return {
+        0: {
+            "name": "Laplacian",
+            "Aop": Laplacian.Aop,
+            "target": eqs[0]["target"],
+            "param": (None,),
+            "sign": 1.0,
+            "other": None,
+            "A_coeffs": A_fused,
+            "adjust_rhs": FDC.laplacian.adjust_rhs,
+        }
+    }
@@ -26,64 +26,52 @@ class SolverConfig(TypedDict):
     fdm: FDMSolverConfig
 
 
-def default_A_ops(var: Field, ops: str) -> list[list[Tensor]]:
+def default_A_ops(var: Field, ops: str) -> Tensor:
     """Construct A_ops for the given order of the spatial discretization (the second order central difference scheme).
 
     Example:
 
     - Below returned results are simplified for the sake of readability.
-    The actual results are the list of the tensor that has the same shape as the given `var`.
+    The actual result is a single tensor with the shape of `(3, mesh.dim, var.dim, *mesh.nx)`.
 
-    >>> App, Ap, Ac, Am, Amm = default_A_ops(var, order=1)
-    [0, ...], [1, ...], [-2, ...], [1, ...], [0, ...]
-    >>> App, Ap, Ac, Am, Amm = default_A_ops(var, order=2)
-    [0, ...], [1, ...], [0, ...], [-1, ...], [0, ...]
+    >>> Ap, Ac, Am = default_A_ops(var, order=1)
+    [1, ...], [-2, ...], [1, ...]
+    >>> Ap, Ac, Am = default_A_ops(var, order=2)
+    [1, ...], [0, ...], [-1, ...]
 
     Args:
         var (Field): The field to be discretized.
         order (int): The order of the spatial discretization. Should be either 1 or 2.
 
     Returns:
-        list[list[Tensor]]: A_ops for the given order of the spatial discretization. The coefficients are for `i+2`, `i+1`, `i`, `i-1`, `i-2` respectively.
+        Tensor: A_ops for the given order of the spatial discretization. The leading dimension is for the coefficients of `i+1`, `i`, `i-1` respectively. Only the bands used by the second order schemes are stored (a wider scheme, e.g. `quick`, can store `i+2` and `i-2` as well since the stencil width is inferred from the leading dimension). Unpacking the leading dimension gives views, therefore, modifying each coefficient in-place updates the returned tensor.
     """
 
+    A_ops = torch.zeros(
+        (3, var.mesh.dim, *var().shape), dtype=var().dtype, device=var().device
+    )
+    Ap, Ac, Am = A_ops
+
     if ops.lower() == "grad":
         # Axisymmetric coordinate has same first order discretization as the cartesian case.
-        App = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-        Ap = [torch.ones_like(var()) for _ in range(var.mesh.dim)]
-        Ac = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-        Am = [-1.0 * torch.ones_like(var()) for _ in range(var.mesh.dim)]
-        Amm = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
+        Ap.fill_(1.0)
+        Am.fill_(-1.0)
     elif ops.lower() == "div":
-        if var.mesh.coord_sys == "xyz":
-            App = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-            Ap = [torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Ac = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-            Am = [-1.0 * torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Amm = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-        else:
+        Ap.fill_(1.0)
+        Am.fill_(-1.0)
+
+        if var.mesh.coord_sys != "xyz":
             r_coord = var.mesh.R
             dr = var.mesh.dx[0]
 
             scale = torch.nan_to_num(2 * dr / r_coord, nan=0.0, posinf=0.0, neginf=0.0)
-            App = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-            Ap = [torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Ac = [
-                scale * torch.ones_like(var()) if i == 0 else torch.zeros_like(var())
-                for i in range(var.mesh.dim)
-            ]
-            Am = [-1.0 * torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Amm = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-            if var.dim == 1:
-                pass
+            Ac[0] = scale
     elif ops.lower() == "laplacian":
-        if var.mesh.coord_sys == "xyz":
-            App = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-            Ap = [torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Ac = [-2.0 * torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Am = [torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Amm = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-        else:
+        Ap.fill_(1.0)
+        Ac.fill_(-2.0)
+        Am.fill_(1.0)
+
+        if var.mesh.coord_sys != "xyz":
             r_coord = var.mesh.R
             dr = var.mesh.dx[0]
 
@@ -91,22 +79,9 @@ def default_A_ops(var: Field, ops: str) -> list[list[Tensor]]:
                 dr / (2 * r_coord), nan=0.0, posinf=0.0, neginf=0.0
             )
 
-            App = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
-            Ap = [
-                (1 + scale) * torch.ones_like(var())
-                if i == 0
-                else torch.ones_like(var())
-                for i in range(var.mesh.dim)
-            ]
-            Ac = [-2.0 * torch.ones_like(var()) for _ in range(var.mesh.dim)]
-            Am = [
-                (1 - scale) * torch.ones_like(var())
-                if i == 0
-                else torch.ones_like(var())
-                for i in range(var.mesh.dim)
-            ]
-            Amm = [torch.zeros_like(var()) for _ in range(var.mesh.dim)]
+            Ap[0] = 1 + scale
+            Am[0] = 1 - scale
     else:
         raise RuntimeError(f"Given {ops=} should be either grad, div, or laplacian.")
 
-    return [App, Ap, Ac, Am, Amm]
+    return A_ops
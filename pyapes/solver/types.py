@@ -46,10 +46,8 @@ class OPStype(TypedDict):
 
     name: str
     """Operator names"""
-    Aop: Callable[
-        [Tensor | float | None, Field, list[list[Tensor]]], Tensor
-    ] | Callable[
-        [Field | Tensor | float, DiscretizerConfigType, Field, list[list[Tensor]]],
+    Aop: Callable[[Tensor | float | None, Field, Tensor], Tensor] | Callable[
+        [Field | Tensor | float, DiscretizerConfigType, Field, Tensor],
         Tensor,
     ]
     """Linear system operator. `Aop` is equivalent to `Ax` in `Ax = b`."""
@@ -63,7 +61,7 @@ class OPStype(TypedDict):
     """Sign to be applied."""
     other: dict[str, float] | None
     """Additional information. e.g. `dt` in `Ddt`."""
-    A_coeffs: list[list[Tensor]]
+    A_coeffs: Tensor
     """Coefficients of the discretization."""
     adjust_rhs: GEN_RHS | DIV_RHS
     # adjust_rhs: Any
@@ -17,6 +17,7 @@ from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Callable
 from typing import get_args
+from typing import get_origin
 from typing import NamedTuple
 from typing import TypedDict
 
@@ -94,6 +95,13 @@ class BC(ABC):
         self._bc_n_vec = torch.zeros(3, dtype=self.dtype.float, device=self.device)
         self._bc_n_vec[self.bc_face_dim] = self.bc_n_dir
 
+        # Indices of the masks. Since the masks are fixed, indexing with the precomputed indices avoids evaluating the boolean masks (`nonzero`) every time the BC is applied.
+        self._bc_idx = torch.nonzero(self.bc_mask, as_tuple=True)
+        self._bc_idx_prev = torch.nonzero(self._bc_mask_prev, as_tuple=True)
+        self._bc_idx_prev2 = torch.nonzero(self._bc_mask_prev2, as_tuple=True)
+        self._bc_idx_forward = torch.nonzero(self._bc_mask_forward, as_tuple=True)
+        self._bc_idx_forward2 = torch.nonzero(self._bc_mask_forward2, as_tuple=True)
+
     def bc_mask_shift(self, shift: int) -> Tensor:
         """Shift `bc_mask` by `shift` indices in the direction of `self.bc_face_dim`.
         Negative `shift` will return previous location, while positive `shift` will return forward location.
@@ -154,6 +162,31 @@ class BC(ABC):
         """
         return self._bc_mask_forward2
 
+    @property
+    def bc_idx(self) -> tuple[Tensor, ...]:
+        """Indices of `bc_mask`. Gives the same elements in the same order as indexing with `bc_mask`."""
+        return self._bc_idx
+
+    @property
+    def bc_idx_prev(self) -> tuple[Tensor, ...]:
+        """Indices of `bc_mask_prev`."""
+        return self._bc_idx_prev
+
+    @property
+    def bc_idx_prev2(self) -> tuple[Tensor, ...]:
+        """Indices of `bc_mask_prev2`."""
+        return self._bc_idx_prev2
+
+    @property
+    def bc_idx_forward(self) -> tuple[Tensor, ...]:
+        """Indices of `bc_mask_forward`."""
+        return self._bc_idx_forward
+
+    @property
+    def bc_idx_forward2(self) -> tuple[Tensor, ...]:
+        """Indices of `bc_mask_forward2`."""
+        return self._bc_idx_forward2
+
     @property
     def bc_treat(self) -> bool:
         """Whether the special treatment is needed for discretization or rhs."""
@@ -202,13 +235,13 @@ class Dirichlet(BC):
 
         if callable(self.bc_val):
             at_bc = self.bc_val(grid, self.bc_mask, var, self.bc_val_opt)
-            var[var_dim, self.bc_mask] = at_bc
+            var[(var_dim, *self.bc_idx)] = at_bc
         elif isinstance(self.bc_val, list):
-            var[var_dim, self.bc_mask] = self.bc_val[var_dim]
+            var[(var_dim, *self.bc_idx)] = self.bc_val[var_dim]
         elif isinstance(self.bc_val, int | float):
-            var[var_dim, self.bc_mask] = float(self.bc_val)
+            var[(var_dim, *self.bc_idx)] = float(self.bc_val)
         elif isinstance(self.bc_val, Tensor):
-            var[var_dim, self.bc_mask] = self.bc_val
+            var[(var_dim, *self.bc_idx)] = self.bc_val
         else:
             raise TypeError("Dirichlet: bc_val must be float, int, callable or list!")
 
@@ -226,12 +259,12 @@ class Neumann(BC):
         assert self.bc_val is not None, "BC: bc_val is not specified!"
 
         dx = (
-            grid[self.bc_face_dim][self.bc_mask]
-            - grid[self.bc_face_dim][self.bc_mask_prev]
+            grid[self.bc_face_dim][self.bc_idx]
+            - grid[self.bc_face_dim][self.bc_idx_prev]
         )
 
-        var_p = var[var_dim][self.bc_mask_prev]
-        var_pp = var[var_dim][self.bc_mask_prev2]
+        var_p = var[(var_dim, *self.bc_idx_prev)]
+        var_pp = var[(var_dim, *self.bc_idx_prev2)]
 
         # Neumann BC:
         # Second order forward-backward difference gives
@@ -248,7 +281,7 @@ class Neumann(BC):
         else:
             raise TypeError("Neumann: bc_val must be float, int, callable or list!")
 
-        var[var_dim][self.bc_mask] = (
+        var[(var_dim, *self.bc_idx)] = (
             4 / 3 * var_p - 1 / 3 * var_pp + 2 / 3 * c_bc_val * dx * self.bc_n_dir
         )
 
@@ -259,7 +292,7 @@ class Symmetry(BC):
     def apply(self, var: Tensor, grid: tuple[Tensor, ...], var_dim: int) -> None:
         assert grid
 
-        var[var_dim, self.bc_mask] = var[var_dim, self.bc_mask_prev]
+        var[(var_dim, *self.bc_idx)] = var[(var_dim, *self.bc_idx_prev)]
 
 
 class Periodic(BC):
@@ -270,21 +303,22 @@ class Periodic(BC):
 
         if self.bc_n_dir < 0:
             # Left hand side take other side's value
-            var_p = var[var_dim, self.bc_mask_prev]
-            var_f = var[var_dim, self.bc_mask_forward]
-            var_ff = var[var_dim, self.bc_mask_forward2]
-            var[var_dim, self.bc_mask] = var_p - var_f + var_ff
+            var_p = var[(var_dim, *self.bc_idx_prev)]
+            var_f = var[(var_dim, *self.bc_idx_forward)]
+            var_ff = var[(var_dim, *self.bc_idx_forward2)]
+            var[(var_dim, *self.bc_idx)] = var_p - var_f + var_ff
 
         else:
             # Right hand side keep its value
-            var[var_dim, self.bc_mask] = var[var_dim, self.bc_mask_forward]
+            var[(var_dim, *self.bc_idx)] = var[(var_dim, *self.bc_idx_forward)]
 
 
 def _bc_val_type_check(bc_val: BC_val_type):
     """Check whether the bc_val is of the correct type."""
 
     if not isinstance(bc_val, Callable):
-        if type(bc_val) not in get_args(BC_val_type):
+        # Generic aliases (e.g. `list[float]`) are compared by their origin type (`list`)
+        if type(bc_val) not in [get_origin(t) or t for t in get_args(BC_val_type)]:
             raise TypeError(
                 f"BC: wrong bc variable -> {type(bc_val)} is not one of {get_args(BC_val_type)}!"
             )
@@ -465,3 +499,67 @@ BC_FACTORY: dict[
     "symmetry": Symmetry,
     "periodic": Periodic,
 }
+
+
+class DirichletBatch:
+    """Consecutive Dirichlet BCs with constant values (`int`, `float`, or `list`) merged into a single indexed assignment.
+    Boundary indices and values are precomputed at the construction, therefore, `apply` does not need to evaluate the boolean masks of each face.
+
+    Note:
+        - Where the faces overlap (e.g. corners), the value of the later BC is used as in the sequential application.
+    """
+
+    def __init__(self, bcs: list[Dirichlet], var_dim: int):
+        self.bcs = bcs
+
+        mask = torch.zeros_like(bcs[0].bc_mask)
+        values = torch.zeros(
+            (var_dim, *mask.shape), dtype=bcs[0].dtype.float, device=bcs[0].device
+        )
+
+        for bc in bcs:
+            for d in range(var_dim):
+                values[d][bc.bc_mask] = (
+                    float(bc.bc_val[d])
+                    if isinstance(bc.bc_val, list)
+                    else float(bc.bc_val)  # type: ignore
+                )
+            mask = torch.logical_or(mask, bc.bc_mask)
+
+        self.bc_idx = torch.nonzero(mask, as_tuple=True)
+        """Indices of all boundary points in the batch."""
+        self.bc_vals = values[(slice(None), *self.bc_idx)]
+        """Boundary values at `bc_idx` for each variable dimension."""
+
+    def apply(self, var: Tensor, grid: tuple[Tensor, ...], var_dim: int) -> None:
+        assert grid
+
+        var[(var_dim, *self.bc_idx)] = self.bc_vals[var_dim]
+
+
+def group_bcs(bcs: list[BC_type], var_dim: int) -> list[BC_type | DirichletBatch]:
+    """Group consecutive Dirichlet BCs with constant values into `DirichletBatch`. Other BCs are kept as they are. The order of the BCs is preserved.
+
+    Args:
+        bcs: list of BCs to be grouped
+        var_dim: dimension of the variable
+    """
+
+    grouped: list[BC_type | DirichletBatch] = []
+    batch: list[Dirichlet] = []
+
+    for bc in bcs:
+        if isinstance(bc, Dirichlet) and isinstance(bc.bc_val, int | float | list):
+            batch.append(bc)
+            continue
+
+        if len(batch) > 0:
+            grouped.append(DirichletBatch(batch, var_dim))
+            batch = []
+
+        grouped.append(bc)
+
+    if len(batch) > 0:
+        grouped.append(DirichletBatch(batch, var_dim))
+
+    return grouped
@@ -49,9 +49,15 @@ class Derivatives:
             hess.xz
             >>> hess["yx"]
             hess.xy
+
+        Note:
+            - If `key` is already the attribute name (e.g. from `derivative_keys`), the string manipulation is skipped.
         """
 
-        item = getattr(self, "".join(sorted(key.lower())))
+        if key not in self.__dataclass_fields__:  # type: ignore
+            key = "".join(sorted(key.lower()))
+
+        item = getattr(self, key)
         if item.shape[0] == 0:
             raise KeyError(f"Derivative: key {key} not found.")
         else:
@@ -14,6 +14,8 @@ from pyapes.mesh import Mesh
 from pyapes.variables.bcs import BC_FACTORY
 from pyapes.variables.bcs import BC_type
 from pyapes.variables.bcs import BCConfig
+from pyapes.variables.bcs import DirichletBatch
+from pyapes.variables.bcs import group_bcs
 
 
 @dataclass
@@ -223,6 +225,9 @@ class Field:
                     at `val[i==insert]`.
         """
 
+        # Keep the precision and device of the field
+        val = val.to(dtype=self.VAR.dtype, device=self.VAR.device)
+
         if self.size == val.shape:
             self._VAR = val
         else:
@@ -234,24 +239,26 @@ class Field:
                     self._VAR[i] = val
         return self
 
-    def __getitem__(self, idx: int | slice) -> torch.Tensor:
-        """Get item using `[]` operator. The idx should be in `var.dim` dimension."""
+    def __getitem__(self, idx: int | slice | tuple) -> torch.Tensor:
+        """Get item using `[]` operator. The idx should be in `var.dim` dimension.
+        If `idx` is a tuple, the first index is for `var.dim` and the rest are for the mesh. e.g. `var[0, mask]` is identical to `var[0][mask]` but indexed at once.
+        """
         if isinstance(idx, slice):
-            return self.VAR
+            return self._VAR
         else:
-            return self.VAR[idx]
+            return self._VAR[idx]
 
-    def __setitem__(self, idx: int | slice, val: Tensor) -> None:
-        """Set item using `[]` operator. The idx should be in `var.dim` dimension."""
+    def __setitem__(self, idx: int | slice | tuple, val: Tensor) -> None:
+        """Set item using `[]` operator. The idx should be in `var.dim` dimension. Tuple `idx` is handled the same as `__getitem__`."""
         if isinstance(idx, slice):
             self.VAR = val
         else:
-            self.VAR[idx] = val
+            self._VAR[idx] = val
 
     def __call__(self) -> Tensor:
         """Return variable."""
 
-        return self.VAR
+        return self._VAR
 
     def __add__(self, other: Any) -> Field:
         """Use `+` operator to add values to the field."""
@@ -420,3 +427,6 @@ class Field:
                 and self.bc_config["obstacle"] is not None
             ):
                 raise NotImplementedError
+
+        self.bcs_grouped: list[BC_type | DirichletBatch] = group_bcs(self.bcs, self.dim)
+        """BCs grouped to reduce the number of operations. Use this to apply all BCs at once."""
@@ -14,6 +14,7 @@ from pyapes.mesh.tools import inner_slicer
 from pyapes.solver.fdc import FDC
 from pyapes.solver.fdm import FDM
 from pyapes.solver.ops import Solver
+from pyapes.solver.ops import _Aop
 from pyapes.testing.burgers import burger_exact_nd
 from pyapes.variables import Field
 from pyapes.variables.bcs import homogeneous_bcs
@@ -301,6 +302,98 @@ def test_solver_fdm_ops(domain: Box, spacing: list[float]) -> None:
         assert_close(solver.rhs, t_rhs)
 
 
+@pytest.mark.parametrize(
+    ["domain", "spacing"],
+    [
+        [Box[0:1], [0.2]],
+        [Box[0:1, 0:1], [0.2, 0.2]],
+    ],
+)
+def test_solver_fused_ops(domain: Box, spacing: list[float]) -> None:
+    """Test that the fused `Aop` is identical to the operator-wise `Aop`."""
+
+    mesh = Mesh(domain, None, spacing)
+
+    var = Field("test_F", 1, mesh, None)
+    var.set_var_tensor(torch.rand_like(var()))
+
+    solver = Solver(None)
+    fdm = FDM({"div": {"limiter": "upwind", "edge": False}})
+
+    solver.set_eq(fdm.div(5.0, var) - fdm.laplacian(3.0, var) == 0.0)
+
+    assert len(solver.eqs) == 2
+    assert len(solver.eqs_solve) == 1
+    assert_close(solver.Aop(var), _Aop(var, solver.eqs))
+
+    # Field advection can not be fused
+    var_j = Field("test_Fj", 1, mesh, None, init_val=5.0)
+    solver.set_eq(fdm.div(var_j, var) - fdm.laplacian(3.0, var) == 0.0)
+
+    assert solver.eqs_solve is solver.eqs
+
+
+@pytest.mark.parametrize("dtype", ["single", "double"])
+def test_numba_stencil(dtype: str) -> None:
+    """Test that the Numba Laplacian kernel is identical to the torch stencil."""
+
+    pytest.importorskip("numba")
+
+    from pyapes.solver import _stencil_numba
+    from pyapes.solver.fdc import _stencil
+
+    for domain, nx in [
+        [Box[0:1], [7]],
+        [Box[0:1, 0:1], [7, 6]],
+        [Box[0:1, 0:1, 0:1], [5, 6, 7]],
+    ]:
+        mesh = Mesh(domain, None, nx, dtype=dtype)
+
+        for var_dim in [1, mesh.dim]:
+            var = Field("test_F", var_dim, mesh, None)
+            var.set_var_tensor(torch.rand_like(var()))
+
+            A_coeffs = torch.rand(3, mesh.dim, *var().shape, dtype=var().dtype)
+
+            assert_close(
+                _stencil_numba.laplacian(A_coeffs, var()),
+                _stencil("Laplacian", A_coeffs, var),
+            )
+
+            # Periodic wrap: the upper end picks up the value at the lower end
+            var.set_var_tensor(torch.zeros_like(var()))
+            var()[(slice(None), *[0] * mesh.dim)] = 1.0
+
+            lap_numba = _stencil_numba.laplacian(A_coeffs, var())
+
+            assert lap_numba[(slice(None), -1, *[0] * (mesh.dim - 1))].sum() != 0.0
+            assert_close(lap_numba, _stencil("Laplacian", A_coeffs, var))
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
+@pytest.mark.parametrize("dtype", ["single", "double"])
+def test_cuda_stencil(dtype: str) -> None:
+    """Test that the CUDA Laplacian kernel is identical to the torch stencil."""
+
+    from pyapes.solver import _stencil_cuda
+    from pyapes.solver.fdc import _stencil
+
+    if not _stencil_cuda.available():
+        pytest.skip("CUDA stencil extension can not be compiled")
+
+    mesh = Mesh(Box[0:1, 0:1, 0:1], None, [5, 6, 7], device="cuda", dtype=dtype)
+
+    var = Field("test_F", 3, mesh, None)
+    var.set_var_tensor(torch.rand_like(var()))
+
+    A_coeffs = torch.rand(3, mesh.dim, *var().shape, dtype=var().dtype, device="cuda")
+
+    assert_close(
+        _stencil_cuda.laplacian_3d(A_coeffs, var()),
+        _stencil("Laplacian", A_coeffs, var),
+    )
+
+
 class TestPrototype_LaplacianCoeffs:
     f_test = torch.linspace(0, 1, 6) ** 2
 
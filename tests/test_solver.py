@@ -88,6 +88,39 @@ def test_poisson_nd_pure_dirichlet(domain: Box, spacing: list[float], dim: int)
     assert_close(var()[0], sol_ex, rtol=0.1, atol=0.01)
 
 
+def test_poisson_2d_single_precision() -> None:
+    """Test poisson with the single precision mesh. The FP32 tolerance is used for the solver."""
+
+    # Construct mesh
+    mesh = Mesh(Box[0:1, 0:1], None, [0.02, 0.02], dtype="single")
+
+    f_bc = poisson_bcs(2)  # BC config
+
+    # Target variable
+    var = Field("p", 1, mesh, {"domain": f_bc, "obstacle": None})
+    rhs = poisson_rhs_nd(mesh, var)  # RHS
+    sol_ex = poisson_exact_nd(mesh)  # exact solution
+
+    solver = Solver(
+        {
+            "fdm": {
+                "method": "cg",
+                "tol": 1e-5,
+                "max_it": 1000,
+                "report": True,
+            }
+        }
+    )
+    fdm = FDM()
+
+    solver.set_eq(fdm.laplacian(1.0, var) == rhs)
+    solver.solve()
+
+    assert var().dtype == torch.float32
+    assert solver.report["converge"] == True
+    assert_close(var()[0], sol_ex, rtol=0.1, atol=0.01)
+
+
 def test_heat_conduction_2d_mixed() -> None:
     r"""Heat conduction (the Laplace equation) in 2D with mixed boundary conditions.
 
@@ -6,11 +6,15 @@ from torch.testing import assert_close
 
 from pyapes.geometry import Box
 from pyapes.geometry import Cylinder
+from pyapes.geometry.basis import derivative_keys
 from pyapes.mesh import Mesh
 from pyapes.solver.fdc import DiffFlux
+from pyapes.solver.fdc import FDC
 from pyapes.solver.fdc import hessian
 from pyapes.solver.fdc import jacobian
 from pyapes.variables import Field
+from pyapes.variables.container import Hess
+from pyapes.variables.container import Jac
 
 
 def test_diff_flux() -> None:
@@ -44,6 +48,22 @@ def test_diff_flux() -> None:
 
     assert_close(flux[1], hess.rz * grad[0] + hess.zz * grad[1])
 
+    # User defined (not from `hessian`) diffusion tensor
+    diff = Hess(rr=hess.rr, rz=hess.rz, zz=hess.zz)
+
+    assert_close(DiffFlux()(diff, var)(), flux())
+
+    # User defined advection (Jacobian) in the rz coordinate
+    fdc = FDC({"div": {"limiter": "none", "edge": False}})
+
+    adv = Field("adv", 2, mesh, None)
+    adv.set_var_tensor(torch.stack([mesh.grid[0], mesh.grid[1] ** 2]))
+
+    div_field = fdc.div(adv, var)
+    fdc.div.reset()
+
+    assert_close(fdc.div(Jac(r=adv[0], z=adv[1]), var), div_field)
+
 
 def test_jac_and_hess() -> None:
     mesh = Mesh(Box[0:1, 0:1, 0:1], None, [3, 3, 3])
@@ -71,6 +91,11 @@ def test_jac_and_hess() -> None:
 
     assert_close(hess.xy, hess["yx"])
 
+    jac_keys, hess_keys = derivative_keys(mesh.coord_sys)
+
+    assert_close(hess.xy, hess[hess_keys[1, 0]])
+    assert_close(jac.y, jac[jac_keys[1]])
+
     with pytest.raises(KeyError):
         jac["z"]
 
@@ -11,7 +11,9 @@ from pyapes.mesh import Mesh
 from pyapes.variables import Field
 from pyapes.variables.bcs import BoxBoundary
 from pyapes.variables.bcs import CylinderBoundary
+from pyapes.variables.bcs import DirichletBatch
 from pyapes.variables.bcs import homogeneous_bcs
+from pyapes.variables.bcs import mixed_bcs
 
 
 @pytest.mark.parametrize(
@@ -85,6 +87,31 @@ def test_bc_config() -> None:
     assert f_bc() == bc_config
 
 
+def test_bc_grouped() -> None:
+    """Batched Dirichlet BCs should give the same result as the sequential application."""
+
+    mesh = Mesh(Box[0:1, 0:1], None, [5, 5])
+
+    f_bc = mixed_bcs(
+        [1.0, 2.0, 0.5, [4.0, 5.0]], ["dirichlet", "dirichlet", "neumann", "dirichlet"]
+    )
+    var = Field("test", 2, mesh, {"domain": f_bc, "obstacle": None}, init_val="random")
+    var_ref = var.copy()
+
+    assert len(var.bcs_grouped) == 3
+    assert isinstance(var.bcs_grouped[0], DirichletBatch)
+    assert isinstance(var.bcs_grouped[2], DirichletBatch)
+
+    for d in range(var.dim):
+        for bc in var.bcs_grouped:
+            bc.apply(var(), mesh.grid, d)
+
+        for bc in var_ref.bcs:
+            bc.apply(var_ref(), mesh.grid, d)
+
+    assert_close(var(), var_ref())
+
+
 @pytest.mark.parametrize(
     ["domain", "spacing", "dim"],
     [